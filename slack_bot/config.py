@@ -19,11 +19,15 @@ class Settings(BaseSettings):
     # Server configuration
     slack_bot_port: int = Field(default=8003, alias="SLACK_BOT_PORT")
     slack_bot_host: str = Field(default="0.0.0.0", alias="SLACK_BOT_HOST")
+    slack_bot_workers: int = Field(default=1, alias="SLACK_BOT_WORKERS")
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
 
     # Service URLs
     expert_api_url: str = Field(default="http://localhost:8002", alias="EXPERT_API_URL")
 
+    # Expert search batching
+    expert_batch_window_ms: int = Field(default=20, alias="EXPERT_BATCH_WINDOW_MS")
+
     # Slack API Configuration
     slack_bot_auth_token: str = Field(default="", alias="SLACK_BOT_AUTH_TOKEN")
     slack_client_id: str = Field(default="", alias="SLACK_CLIENT_ID")
@@ -13,7 +13,12 @@ from slack_sdk.web.async_client import AsyncWebClient
 
 from config import settings
 from models import HealthResponse, SlackEventsRequest, SlackEventsResponse
-from services import EventProcessor, ExpertAPIClient, SkillCacheService
+from services import (
+    EventProcessor,
+    ExpertAPIClient,
+    ExpertBatcher,
+    SkillCacheService,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -24,6 +29,7 @@ logger = logging.getLogger(__name__)
 
 # Initialize services (will be set in lifespan)
 expert_api_client: ExpertAPIClient | None = None
+expert_batcher: ExpertBatcher | None = None
 skill_cache_service: SkillCacheService | None = None
 event_processor: EventProcessor | None = None
 slack_client: AsyncWebClient | None = None
@@ -32,7 +38,8 @@ slack_client: AsyncWebClient | None = None
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """FastAPI lifespan manager for startup/shutdown tasks"""
-    global expert_api_client, skill_cache_service, event_processor, slack_client
+    global expert_api_client, expert_batcher, skill_cache_service, event_processor
+    global slack_client
 
     # Initialize Sentry
     if settings.sentry_dsn:
@@ -48,6 +55,10 @@ async def lifespan(app: FastAPI):
 
     slack_client = AsyncWebClient(token=settings.slack_bot_auth_token)
     expert_api_client = ExpertAPIClient(base_url=settings.expert_api_url)
+    expert_batcher = ExpertBatcher(
+        expert_api_client, batch_window_ms=settings.expert_batch_window_ms
+    )
+    expert_batcher.start()
 
     # Check Expert API availability
     try:
@@ -82,6 +93,8 @@ async def lifespan(app: FastAPI):
 
     yield
 
+    await expert_batcher.stop()
+
     logger.info(
         f"Shutting down {settings.service_name}({settings.service_version}) service..."
     )
@@ -129,6 +142,11 @@ async def slack_events(payload: SlackEventsRequest):
         if not event_processor:
             return SlackEventsResponse(ok=False, message="Service not initialized")
 
+        # Slack redelivers an event when the ack is slow; reply to it only once
+        if event_processor.is_duplicate_event(payload.event_id):
+            logger.info(f"Ignoring duplicate Slack event: {payload.event_id}")
+            return SlackEventsResponse(ok=True, message="Duplicate event ignored")
+
         try:
             event_data = payload.model_dump()
             event_type = event_data.get("event", {}).get("type")
@@ -149,14 +167,14 @@ async def slack_events(payload: SlackEventsRequest):
                     f"for skills: {expert_query.skills}"
                 )
 
-                if not expert_api_client:
+                if not expert_batcher:
                     return SlackEventsResponse(
                         ok=False, message="Expert API client not initialized"
                     )
 
                 try:
-                    # Call Expert API to find experts
-                    search_response = await expert_api_client.search_experts(
+                    # Call Expert API to find experts (batched with concurrent events)
+                    search_response = await expert_batcher.search_experts(
                         skills=expert_query.skills,
                         limit=5,  # Limit results for Slack
                         min_confidence=0.7,  # Only high-confidence matches
@@ -232,8 +250,6 @@ async def slack_oauth_callback(code: str | None = None, error: str | None = None
         return {"error": "No authorization code provided"}
 
     # Exchange authorization code for access token
-    import httpx
-
     try:
         async with httpx.AsyncClient() as client:
             response = await client.post(
@@ -552,6 +568,7 @@ if __name__ == "__main__":
         "main:app",
         host=settings.slack_bot_host,
         port=settings.slack_bot_port,
-        reload=True,
+        reload=settings.debug,
+        workers=settings.slack_bot_workers,
         log_level=settings.log_level.lower(),
     )
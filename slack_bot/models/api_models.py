@@ -15,6 +15,7 @@ class SlackEventsRequest(BaseModel):
     challenge: str | None = None
     team_id: str | None = None
     api_app_id: str | None = None
+    event_id: str | None = None
 
 
 class SlackEventsResponse(BaseModel):
@@ -2,6 +2,7 @@
 
 from .event_processor import EventProcessor
 from .expert_api_client import ExpertAPIClient
+from .expert_batcher import ExpertBatcher
 from .query_parser import QueryParser
 from .skill_cache_service import SkillCacheService
 from .slack_event_parser import SlackEventParser
@@ -9,6 +10,7 @@ from .slack_event_parser import SlackEventParser
 __all__ = [
     "EventProcessor",
     "ExpertAPIClient",
+    "ExpertBatcher",
     "QueryParser",
     "SkillCacheService",
     "SlackEventParser",
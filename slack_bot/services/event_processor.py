@@ -1,6 +1,7 @@
 """Main event processing service that coordinates Slack event handling"""
 
 import logging
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any
 
 import sentry_sdk
@@ -14,6 +15,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Recent event_ids remembered, so Slack retries of an event are not handled twice.
+# The record is per process, which only covers retries with a single worker.
+_SEEN_EVENTS_SIZE = 1024
+
 
 class EventProcessor:
     """Coordinates Slack event processing and expert query extraction"""
@@ -25,6 +30,23 @@ class EventProcessor:
         self.query_parser = QueryParser(skill_cache_service)
         self.bot_user_id = bot_user_id
 
+        # LRU of recently handled event_ids
+        self._seen_event_ids: OrderedDict[str, None] = OrderedDict()
+
+    def is_duplicate_event(self, event_id: str | None) -> bool:
+        """Record an event_id and report whether it was already seen"""
+        if event_id is None:
+            return False
+
+        if event_id in self._seen_event_ids:
+            self._seen_event_ids.move_to_end(event_id)
+            return True
+
+        self._seen_event_ids[event_id] = None
+        if len(self._seen_event_ids) > _SEEN_EVENTS_SIZE:
+            self._seen_event_ids.popitem(last=False)
+        return False
+
     @sentry_sdk.trace
     async def process_slack_event(
         self, event_data: dict[str, Any]
@@ -98,5 +120,6 @@ class EventProcessor:
         return {
             "supported_skills_count": len(skills),
             "query_patterns_count": len(self.query_parser.compiled_patterns),
+            "query_type_hits": dict(self.query_parser.pattern_hits.most_common()),
             "bot_user_id": self.slack_parser.bot_user_id,
         }
@@ -0,0 +1,148 @@
+"""Micro-batching of concurrent expert searches"""
+
+import asyncio
+import logging
+
+from .expert_api_client import ExpertAPIClient, ExpertSearchResponse
+
+logger = logging.getLogger(__name__)
+
+SearchKey = tuple[tuple[str, ...], int, float]
+
+
+class ExpertBatcher:
+    """
+    Collects expert searches that arrive within a short window and
+    dispatches them together.
+
+    Expert API has no batch search endpoint yet, so each batch is sent as
+    concurrent single searches bounded by a semaphore. Identical searches
+    within one window share a single request.
+    """
+
+    def __init__(
+        self,
+        expert_api_client: ExpertAPIClient,
+        batch_window_ms: int = 20,
+        max_batch_size: int = 32,
+        max_concurrency: int = 8,
+    ):
+        self.expert_api_client = expert_api_client
+        self.batch_window = batch_window_ms / 1000
+        self.max_batch_size = max_batch_size
+
+        self._queue: asyncio.Queue[tuple[SearchKey, asyncio.Future]] = asyncio.Queue()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._task: asyncio.Task | None = None
+        self._dispatch_tasks: set[asyncio.Task] = set()
+        self._stopped = False
+
+        logger.info(
+            f"ExpertBatcher initialized (window: {batch_window_ms}ms, "
+            f"max batch: {max_batch_size}, max concurrency: {max_concurrency})"
+        )
+
+    def start(self) -> None:
+        """Start the background batching loop"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the batching loop and wait for in-flight searches"""
+        self._stopped = True
+
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        if self._dispatch_tasks:
+            await asyncio.gather(*self._dispatch_tasks, return_exceptions=True)
+
+        # Fail anything that was queued but never picked up
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.cancel()
+
+    async def search_experts(
+        self, skills: list[str], limit: int = 10, min_confidence: float = 0.0
+    ) -> ExpertSearchResponse:
+        """Queue an expert search and wait for its batched result"""
+        if self._stopped:
+            raise RuntimeError("ExpertBatcher is stopped")
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(((tuple(skills), limit, min_confidence), future))
+        return await future
+
+    async def _run(self) -> None:
+        """Assemble batches from the queue and dispatch them"""
+        loop = asyncio.get_running_loop()
+        batch: list[tuple[SearchKey, asyncio.Future]] = []
+
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                deadline = loop.time() + self.batch_window
+
+                while len(batch) < self.max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except TimeoutError:
+                        break
+
+                # Dispatch in the background so the next window can start
+                # collecting
+                self._start_dispatch(batch)
+                batch = []
+        finally:
+            # Stopped mid-window: still send what was already collected, so
+            # its callers don't wait forever (stop() awaits the dispatch)
+            if batch:
+                self._start_dispatch(batch)
+
+    def _start_dispatch(self, batch: list[tuple[SearchKey, asyncio.Future]]) -> None:
+        """Dispatch a batch in a tracked background task"""
+        task = asyncio.create_task(self._dispatch(batch))
+        self._dispatch_tasks.add(task)
+        task.add_done_callback(self._dispatch_tasks.discard)
+
+    async def _dispatch(self, batch: list[tuple[SearchKey, asyncio.Future]]) -> None:
+        """Run one batch of searches, sharing requests between identical queries"""
+        waiters: dict[SearchKey, list[asyncio.Future]] = {}
+        for key, future in batch:
+            waiters.setdefault(key, []).append(future)
+
+        logger.debug(
+            f"Dispatching batch of {len(batch)} searches "
+            f"({len(waiters)} distinct requests)"
+        )
+
+        keys = list(waiters)
+        results = await asyncio.gather(
+            *(self._search(key) for key in keys), return_exceptions=True
+        )
+
+        for key, result in zip(keys, results, strict=True):
+            for future in waiters[key]:
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    async def _search(self, key: SearchKey) -> ExpertSearchResponse:
+        """Run a single search against Expert API"""
+        skills, limit, min_confidence = key
+        async with self._semaphore:
+            return await self.expert_api_client.search_experts(
+                skills=list(skills), limit=limit, min_confidence=min_confidence
+            )
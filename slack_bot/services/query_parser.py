@@ -2,6 +2,7 @@
 
 import logging
 import re
+from collections import Counter
 from typing import TYPE_CHECKING
 
 import sentry_sdk
@@ -9,10 +10,129 @@ import sentry_sdk
 from models.slack_models import ExpertQuery, ParsedSlackMessage
 
 if TYPE_CHECKING:
-    from .skill_cache_service import SkillCacheService
+    from .skill_cache_service import SkillCacheService, SkillSnapshot
 
 logger = logging.getLogger(__name__)
 
+# Common words that might interfere with skill matching
+_STOPWORDS = frozenset({"and", "or", "with", "in", "on", "at", "the", "a", "an"})
+
+# Stopwords plus filler words that are never useful for partial matching
+_STOPWORDS_EXTENDED = _STOPWORDS | frozenset({"stuff", "things"})
+
+# Potential skill tokens: runs of anything but spaces and common separators
+_TOKEN_PATTERN = re.compile(r"[^,\s/&+\-]+")
+
+# Query patterns for different types of expert searches.
+# Patterns are lowercase and matched against lowercased text.
+_QUERY_PATTERNS = (
+    # "Who knows X?" patterns
+    (r"who knows?\s+(?:about\s+)?(.+?)(?:\?|$)", "who_knows"),
+    (
+        r"who is\s+(?:an?\s+)?expert\s+(?:in|on|with|at)\s+(.+?)(?:\?|$)",
+        "expert_in",
+    ),
+    (r"who can help\s+(?:me\s+)?(?:with\s+)?(.+?)(?:\?|$)", "help_with"),
+    (r"who has experience\s+(?:with\s+)?(.+?)(?:\?|$)", "experience_with"),
+    (
+        r"find\s+(?:me\s+)?(?:an?\s+)?expert\s+(?:in|on|with|for)\s+(.+?)(?:\?|$)",
+        "find_expert",
+    ),
+    (
+        r"need\s+(?:an?\s+)?expert\s+(?:in|on|with|for)\s+(.+?)(?:\?|$)",
+        "need_expert",
+    ),
+    # "I need a/an [skill] expert" patterns
+    (r"(?:i\s+)?need\s+(?:an?\s+)?(.+?)\s+expert(?:\?|$)", "need_skill_expert"),
+    (
+        r"looking for\s+(?:an?\s+)?expert\s+(?:in|on|with)\s+(.+?)(?:\?|$)",
+        "looking_for",
+    ),
+    # "Looking for [skill] expert" patterns
+    (
+        r"looking for\s+(?:an?\s+)?(.+?)\s+expert(?:\?|$)",
+        "looking_for_skill_expert",
+    ),
+    (r"anyone know\s+(?:about\s+)?(.+?)(?:\?|$)", "anyone_know"),
+    (r"who should i ask about\s+(.+?)(?:\?|$)", "who_ask"),
+    (
+        r"who's\s+(?:the\s+)?(?:best|good)\s+(?:at|with)\s+(.+?)(?:\?|$)",
+        "best_at",
+    ),
+    # "I need help with X" patterns
+    (r"(?:i\s+)?need help\s+(?:with\s+)?(.+?)(?:\?|$)", "need_help"),
+    # "Find me a/an [skill] expert" patterns
+    (
+        r"find\s+(?:me\s+)?(?:an?\s+)?(.+?)\s+expert(?:\?|$)",
+        "find_skill_expert",
+    ),
+    (
+        r"(?:can\s+)?(?:someone\s+)?help\s+(?:me\s+)?(?:with\s+)?(.+?)(?:\?|$)",
+        "help_request",
+    ),
+    (r"advice\s+(?:on\s+)?(.+?)(?:\?|$)", "advice_on"),
+    (r"guidance\s+(?:on\s+)?(.+?)(?:\?|$)", "guidance_on"),
+)
+
+# Compile regex patterns. Matching lowercased text case-sensitively keeps
+# sre on its fast literal-prefix search, which IGNORECASE disables.
+_COMPILED_PATTERNS = tuple(
+    (re.compile(pattern), query_type) for pattern, query_type in _QUERY_PATTERNS
+)
+
+# Same patterns compiled for bytes; sre skips Unicode classification on
+# bytes, which is measurably faster for the (usual) pure-ASCII message
+_COMPILED_BYTES_PATTERNS = tuple(
+    (re.compile(pattern.encode()), query_type)
+    for pattern, query_type in _QUERY_PATTERNS
+)
+
+# A keyword every match of the pattern must contain. Checking it with a
+# plain substring test is much cheaper than a failed regex search, so
+# most patterns are skipped without running the regex at all.
+_PATTERN_KEYWORDS = {
+    "who_knows": "know",
+    "expert_in": "expert",
+    "help_with": "help",
+    "experience_with": "experience",
+    "find_expert": "expert",
+    "need_expert": "expert",
+    "need_skill_expert": "expert",
+    "looking_for": "looking",
+    "looking_for_skill_expert": "expert",
+    "anyone_know": "anyone",
+    "who_ask": "ask",
+    "best_at": "who's",
+    "need_help": "help",
+    "find_skill_expert": "expert",
+    "help_request": "help",
+    "advice_on": "advice",
+    "guidance_on": "guidance",
+}
+
+# Every pattern needs a keyword, or parsing would fail on the lookup
+assert _PATTERN_KEYWORDS.keys() == {query_type for _, query_type in _QUERY_PATTERNS}
+
+# Base confidence for (exact, partial) matches of high-confidence query
+# types; all other types use (0.7, 0.5)
+_BASE_CONFIDENCE = {
+    query_type: (0.9, 0.7)
+    for query_type in (
+        "who_knows",
+        "expert_in",
+        "find_expert",
+        "need_expert",
+        "need_skill_expert",
+        "find_skill_expert",
+        "looking_for_skill_expert",
+    )
+}
+
+
+def _is_word_char(char: str) -> bool:
+    """Check if char is a regex word character (letter, digit or underscore)"""
+    return char.isalnum() or char == "_"
+
 
 class QueryParser:
     """Extracts skills and intent from natural language queries"""
@@ -22,87 +142,60 @@ class QueryParser:
 
         # Skills are now loaded dynamically from database via skill_cache_service
 
-        # Query patterns for different types of expert searches
-        self.query_patterns = [
-            # "Who knows X?" patterns
-            (r"who knows?\s+(?:about\s+)?(.+?)(?:\?|$)", "who_knows"),
-            (
-                r"who is\s+(?:an?\s+)?expert\s+(?:in|on|with|at)\s+(.+?)(?:\?|$)",
-                "expert_in",
-            ),
-            (r"who can help\s+(?:me\s+)?(?:with\s+)?(.+?)(?:\?|$)", "help_with"),
-            (r"who has experience\s+(?:with\s+)?(.+?)(?:\?|$)", "experience_with"),
-            (
-                r"find\s+(?:me\s+)?(?:an?\s+)?expert\s+(?:in|on|with|for)\s+(.+?)(?:\?|$)",
-                "find_expert",
-            ),
-            (
-                r"need\s+(?:an?\s+)?expert\s+(?:in|on|with|for)\s+(.+?)(?:\?|$)",
-                "need_expert",
-            ),
-            # "I need a/an [skill] expert" patterns
-            (r"(?:I\s+)?need\s+(?:an?\s+)?(.+?)\s+expert(?:\?|$)", "need_skill_expert"),
-            (
-                r"looking for\s+(?:an?\s+)?expert\s+(?:in|on|with)\s+(.+?)(?:\?|$)",
-                "looking_for",
-            ),
-            # "Looking for [skill] expert" patterns
-            (
-                r"looking for\s+(?:an?\s+)?(.+?)\s+expert(?:\?|$)",
-                "looking_for_skill_expert",
-            ),
-            (r"anyone know\s+(?:about\s+)?(.+?)(?:\?|$)", "anyone_know"),
-            (r"who should I ask about\s+(.+?)(?:\?|$)", "who_ask"),
-            (
-                r"who's\s+(?:the\s+)?(?:best|good)\s+(?:at|with)\s+(.+?)(?:\?|$)",
-                "best_at",
-            ),
-            # "I need help with X" patterns
-            (r"(?:I\s+)?need help\s+(?:with\s+)?(.+?)(?:\?|$)", "need_help"),
-            # "Find me a/an [skill] expert" patterns
-            (
-                r"find\s+(?:me\s+)?(?:an?\s+)?(.+?)\s+expert(?:\?|$)",
-                "find_skill_expert",
-            ),
-            (
-                r"(?:can\s+)?(?:someone\s+)?help\s+(?:me\s+)?(?:with\s+)?(.+?)(?:\?|$)",
-                "help_request",
-            ),
-            (r"advice\s+(?:on\s+)?(.+?)(?:\?|$)", "advice_on"),
-            (r"guidance\s+(?:on\s+)?(.+?)(?:\?|$)", "guidance_on"),
-        ]
+        self.query_patterns = _QUERY_PATTERNS
+        self.compiled_patterns = _COMPILED_PATTERNS
+        self.pattern_keywords = _PATTERN_KEYWORDS
+        self.base_confidence = _BASE_CONFIDENCE
 
-        # Compile regex patterns
-        self.compiled_patterns = [
-            (re.compile(pattern, re.IGNORECASE), query_type)
-            for pattern, query_type in self.query_patterns
-        ]
+        # How often each query type wins. Patterns are not reordered by this:
+        # the first matching pattern wins, so list order encodes priority.
+        self.pattern_hits: Counter[str] = Counter()
 
     @sentry_sdk.trace
     async def parse_query(self, message: ParsedSlackMessage) -> ExpertQuery | None:
         """Parse a message and extract an expert search query"""
         try:
+            # Take one consistent view of the skill cache for the whole parse
+            snapshot = await self.skill_cache_service.snapshot()
+
             text = message.cleaned_text
             logger.info(f"QueryParser.parse_query called with text: '{text}'")
 
+            # Lowercase once; patterns and skill matching all work on this copy
+            text_lower = text.lower()
+
             # Try to match against known patterns
             logger.info(
                 f"Trying {len(self.compiled_patterns)} patterns against: '{text}'"
             )
-            for pattern, query_type in self.compiled_patterns:
-                match = pattern.search(text)
+            try:
+                search_text = text_lower.encode("ascii")
+                compiled_patterns = _COMPILED_BYTES_PATTERNS
+            except UnicodeEncodeError:
+                search_text = text_lower
+                compiled_patterns = self.compiled_patterns
+
+            for pattern, query_type in compiled_patterns:
+                if self.pattern_keywords[query_type] not in text_lower:
+                    continue
+
+                match = pattern.search(search_text)
                 logger.debug(
-                    f"Pattern '{query_type}': {pattern.pattern} -> {'MATCH' if match else 'no match'}"
+                    "Pattern '%s': %s -> %s",
+                    query_type,
+                    pattern.pattern,
+                    "MATCH" if match else "no match",
                 )
                 if match:
                     skill_text = match.group(1).strip()
+                    if isinstance(skill_text, bytes):
+                        skill_text = skill_text.decode("ascii")
                     logger.info(
                         f"Pattern '{query_type}' matched! Extracted skill_text: '{skill_text}'"
                     )
-                    (
-                        skills,
-                        is_partial,
-                    ) = await self._extract_skills_from_text_with_match_type(skill_text)
+                    skills, is_partial = await self._extract_skills_from_text(
+                        skill_text, snapshot
+                    )
 
                     logger.info(
                         f"Skill extraction result: {skills} (is_partial: {is_partial})"
@@ -112,7 +205,10 @@ class QueryParser:
                             text, skills, query_type, is_partial
                         )
 
-                        query = ExpertQuery(
+                        self.pattern_hits[query_type] += 1
+                        # Fields come from an already validated message, so
+                        # skip re-validating them
+                        query = ExpertQuery.model_construct(
                             original_text=message.text,
                             skills=skills,
                             query_type=query_type,
@@ -132,16 +228,16 @@ class QueryParser:
             logger.info(
                 f"No pattern matched, trying fallback skill extraction on: '{text}'"
             )
-            (
-                fallback_skills,
-                is_partial,
-            ) = await self._extract_skills_from_text_with_match_type(text)
+            fallback_skills, is_partial = await self._extract_skills_from_text(
+                text_lower, snapshot
+            )
 
             if fallback_skills:
+                self.pattern_hits["general_mention"] += 1
                 fallback_confidence = (
                     0.3 if not is_partial else 0.2
                 )  # Even lower confidence for partial fallback
-                query = ExpertQuery(
+                query = ExpertQuery.model_construct(
                     original_text=message.text,
                     skills=fallback_skills,
                     query_type="general_mention",
@@ -161,148 +257,85 @@ class QueryParser:
             logger.error(f"Error parsing query: {e}")
             return None
 
-    @sentry_sdk.trace
-    async def _extract_skills_from_text_with_match_type(
-        self, text: str
+    async def _extract_skills_from_text(
+        self, text_lower: str, snapshot: "SkillSnapshot"
     ) -> tuple[list[str], bool]:
-        """Extract technology skills from text, returning skills and whether partial matching was used"""
-        skills = await self._extract_skills_from_text(text)
-        # For now, track this in the logs - more sophisticated tracking could be added later
-        is_partial = (
-            "partial" in str(self._last_extraction_method)
-            if hasattr(self, "_last_extraction_method")
-            else False
-        )
-        return skills, is_partial
-
-    @sentry_sdk.trace
-    async def _extract_skills_from_text(self, text: str) -> list[str]:
-        """Extract technology skills from text using database skills"""
-        text_lower = text.lower()
-
-        # Remove common words that might interfere
-        words_to_remove = {"and", "or", "with", "in", "on", "at", "the", "a", "an"}
-
-        # Get all skill terms from database (names + aliases)
-        all_skill_terms = await self.skill_cache_service.get_all_skill_terms()
+        """Extract skills from lowercased text, and whether partial matching was used"""
+        # All skill terms from database (names + aliases)
+        all_skill_terms = snapshot.all_skill_terms
         logger.info(f"Available skill terms count: {len(all_skill_terms)}")
         if len(all_skill_terms) == 0:
             logger.error(
                 "CRITICAL: No skill terms available! Skill cache may be empty or Expert API connection failed"
             )
 
-        # Split text into potential skill tokens
-        # Handle both spaces and common separators
-        tokens = re.split(r"[,\s/&+\-]+", text_lower)
-        tokens = [token.strip() for token in tokens if token.strip()]
-        logger.debug(f"Looking for tokens in skill terms: {tokens}")
-
-        # Find exact matches against database skills
-        found_skills = []
-        for token in tokens:
-            in_skill_terms = token in all_skill_terms
-            is_common_word = token in words_to_remove
-            logger.info(
-                f"Checking token: '{token}' (in skill_terms: {in_skill_terms}, is_common_word: {is_common_word})"
-            )
-            if in_skill_terms and not is_common_word:
-                # Get the actual skill info to return the canonical name
-                skill_info = await self.skill_cache_service.get_skill_by_term(token)
-                if skill_info and skill_info.key not in found_skills:
-                    logger.debug(f"Found skill: {skill_info.key} for token: {token}")
-                    found_skills.append(skill_info.key)
-
-        # Look for compound/multi-word skills from database
-        compound_skills = await self._find_compound_skills(text_lower)
-        found_skills.extend(compound_skills)
+        # Find single- and multi-word skills in one pass over the text
+        found_skills: dict[str, None] = {}
+        automaton = snapshot.automaton
+        if automaton is not None:
+            text_length = len(text_lower)
+            hits = []
+            for end, (skill_key, term_length) in automaton.iter(text_lower):
+                start = end - term_length + 1
+
+                # Only accept whole words, so "java" doesn't match "javascript"
+                if start > 0 and _is_word_char(text_lower[start - 1]):
+                    continue
+                if end + 1 < text_length and _is_word_char(text_lower[end + 1]):
+                    continue
+                if text_lower[start : end + 1] in _STOPWORDS:
+                    continue
+
+                hits.append((start, end, skill_key))
+
+            # Keep the leftmost-longest match where terms overlap,
+            # so "c#" doesn't also report "c" and "node.js" doesn't report "js"
+            hits.sort(key=lambda hit: (hit[0], -hit[1]))
+            last_end = -1
+            for start, end, skill_key in hits:
+                if start > last_end:
+                    logger.debug("Found skill: %s at %d-%d", skill_key, start, end)
+                    found_skills[skill_key] = None
+                    last_end = end
 
         # If no exact matches found, try partial matching for multi-word skills
         if not found_skills:
-            partial_skills = await self._find_partial_matches(tokens, all_skill_terms)
-            found_skills.extend(partial_skills)
-            if partial_skills:
-                self._last_extraction_method = "partial_matching"
-            logger.debug(f"Partial matching found: {partial_skills}")
-        else:
-            self._last_extraction_method = "exact_matching"
-
-        # Remove duplicates while preserving order
-        unique_skills = []
-        for skill in found_skills:
-            if skill not in unique_skills:
-                unique_skills.append(skill)
-
-        logger.debug(f"Final unique skills: {unique_skills}")
-        return unique_skills
+            # Split text into potential skill tokens
+            tokens = _TOKEN_PATTERN.findall(text_lower)
 
-    @sentry_sdk.trace
-    async def _find_compound_skills(self, text: str) -> list[str]:
-        """Find compound/multi-word skills from database"""
-        found = []
+            partial_skills = await self._find_partial_matches(tokens, snapshot)
+            logger.debug("Partial matching found: %s", partial_skills)
+            return partial_skills, True
 
-        # Get all skills from database
-        all_skill_terms = await self.skill_cache_service.get_all_skill_terms()
+        skills = list(found_skills)
+        logger.debug("Final unique skills: %s", skills)
+        return skills, False
 
-        # Look for multi-word skills (containing spaces)
-        multi_word_skills = [term for term in all_skill_terms if " " in term]
-
-        for skill_term in multi_word_skills:
-            if skill_term in text:
-                # Get the actual skill info to return the canonical key
-                skill_info = await self.skill_cache_service.get_skill_by_term(
-                    skill_term
-                )
-                if skill_info and skill_info.key not in found:
-                    found.append(skill_info.key)
-
-        return found
-
-    @sentry_sdk.trace
     async def _find_partial_matches(
-        self, tokens: list[str], all_skill_terms: set[str]
+        self, tokens: list[str], snapshot: "SkillSnapshot"
     ) -> list[str]:
         """Find skills where user tokens partially match multi-word skill names/aliases"""
-        found = []
-        words_to_remove = {
-            "and",
-            "or",
-            "with",
-            "in",
-            "on",
-            "at",
-            "the",
-            "a",
-            "an",
-            "stuff",
-            "things",
-        }
+        found: dict[str, None] = {}  # Ordered set of skill keys
 
         # Filter tokens to exclude common words
         meaningful_tokens = [
-            token for token in tokens if token not in words_to_remove and len(token) > 2
+            token
+            for token in tokens
+            if token not in _STOPWORDS_EXTENDED and len(token) > 2
         ]
 
-        logger.debug(f"Meaningful tokens for partial matching: {meaningful_tokens}")
+        logger.debug("Meaningful tokens for partial matching: %s", meaningful_tokens)
 
-        # Check each meaningful token against all skill terms
+        # Look up the skills whose terms contain each meaningful token
         for token in meaningful_tokens:
-            # Find skill terms that contain this token
-            matching_terms = [term for term in all_skill_terms if token in term]
-            logger.debug(
-                f"Token '{token}' matches terms: {matching_terms[:5]}..."
-            )  # Log first 5
-
-            for term in matching_terms:
-                skill_info = await self.skill_cache_service.get_skill_by_term(term)
-                if skill_info and skill_info.key not in found:
-                    logger.debug(
-                        f"Partial match: '{token}' -> '{term}' -> skill '{skill_info.key}'"
-                    )
-                    found.append(skill_info.key)
+            skill_keys = snapshot.substring_to_keys.get(token, ())
+            logger.debug("Partial match: '%s' -> skills %s", token, skill_keys)
 
-        return found
+            for skill_key in skill_keys:
+                found[skill_key] = None
+
+        return list(found)
 
-    @sentry_sdk.trace
     def _calculate_confidence(
         self,
         text: str,
@@ -311,45 +344,25 @@ class QueryParser:
         is_partial_match: bool = False,
     ) -> float:
         """Calculate confidence score for the parsed query"""
-        base_confidence = 0.7
-
-        # Reduce confidence for partial matches
-        if is_partial_match:
-            base_confidence = 0.5
-
-        # Boost confidence for specific query types
-        high_confidence_types = [
-            "who_knows",
-            "expert_in",
-            "find_expert",
-            "need_expert",
-            "need_skill_expert",
-            "find_skill_expert",
-            "looking_for_skill_expert",
-        ]
-        if query_type in high_confidence_types:
-            base_confidence = 0.9 if not is_partial_match else 0.7
-
-        # Boost confidence if multiple skills found
-        if len(skills) > 1:
-            base_confidence += 0.1
-
-        # Boost confidence for skills found in database
-        # Note: All skills are now from database, so all matches are valid
-        if len(skills) > 0:
-            base_confidence += 0.1
-
-        # Reduce confidence for very long skill lists (might be noise)
-        if len(skills) > 3:
-            base_confidence -= 0.1
-
-        # Boost confidence if question mark present
-        if "?" in text:
-            base_confidence += 0.05
+        # Base confidence for (exact, partial) matches, boosted for specific types
+        exact_confidence, partial_confidence = self.base_confidence.get(
+            query_type, (0.7, 0.5)
+        )
+        skill_count = len(skills)
+
+        # Boost for multiple skills, boost for skills found in database (all
+        # matches are from database now), reduce for very long skill lists
+        # (might be noise), boost if a question mark is present
+        confidence = (
+            (partial_confidence if is_partial_match else exact_confidence)
+            + 0.1 * (skill_count > 1)
+            + 0.1 * (skill_count > 0)
+            - 0.1 * (skill_count > 3)
+            + 0.05 * ("?" in text)
+        )
 
-        return min(1.0, base_confidence)
+        return min(1.0, confidence)
 
-    @sentry_sdk.trace
     async def get_supported_skills(self) -> list[str]:
         """Get list of supported skills for validation"""
         skills = await self.skill_cache_service.get_skills()
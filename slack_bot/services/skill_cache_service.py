@@ -2,8 +2,12 @@
 
 import asyncio
 import logging
+import sys
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 
+import ahocorasick
 import sentry_sdk
 
 from .expert_api_client import ExpertAPIClient, SkillInfo
@@ -11,6 +15,16 @@ from .expert_api_client import ExpertAPIClient, SkillInfo
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class SkillSnapshot:
+    """Consistent view of the skill cache, taken once per parsed message"""
+
+    all_skill_terms: frozenset[str]
+    automaton: ahocorasick.Automaton | None  # term -> (skill_key, term_length)
+    # Every substring (3+ chars) of a term -> keys of skills whose terms contain it
+    substring_to_keys: dict[str, tuple[str, ...]]
+
+
 class SkillCacheService:
     """
     Caches skills from Expert API for fast text matching.
@@ -22,51 +36,51 @@ class SkillCacheService:
     def __init__(self, expert_api_client: ExpertAPIClient, cache_ttl_minutes: int = 60):
         self.expert_api_client = expert_api_client
         self.cache_ttl = timedelta(minutes=cache_ttl_minutes)
+        self._cache_ttl_seconds = self.cache_ttl.total_seconds()
 
         # Cache storage
-        self._skills: list[SkillInfo] = []
+        self._skills: tuple[SkillInfo, ...] = ()
         self._skill_names: set[str] = set()
         self._skill_aliases: set[str] = set()
-        self._all_skill_terms: set[str] = set()  # Combined names + aliases
-        self._domains: list[str] = []
-        self._last_refresh: datetime | None = None
+        self._all_skill_terms: frozenset[str] = frozenset()  # Combined names + aliases
+        self._term_to_skill: dict[str, SkillInfo] = {}
+        self._snapshot = SkillSnapshot(
+            all_skill_terms=self._all_skill_terms,
+            automaton=None,
+            substring_to_keys={},
+        )
+        self._domains: tuple[str, ...] = ()
+        self._last_refresh: datetime | None = None  # Wall clock, for stats only
+        self._last_refresh_monotonic: float | None = None
         self._refresh_lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task | None = None
 
         logger.info("SkillCacheService initialized")
 
-    async def get_all_skill_terms(self) -> set[str]:
+    async def get_all_skill_terms(self) -> frozenset[str]:
         """Get all skill terms (names + aliases) for text matching"""
-        await self._ensure_cache_fresh()
-        return self._all_skill_terms.copy()
+        await self.ensure_fresh()
+        return self._all_skill_terms
 
-    async def get_skills(self) -> list[SkillInfo]:
+    async def snapshot(self) -> SkillSnapshot:
+        """Get all skill lookup structures at once for text matching"""
+        await self.ensure_fresh()
+        return self._snapshot
+
+    async def get_skills(self) -> tuple[SkillInfo, ...]:
         """Get all cached skills"""
-        await self._ensure_cache_fresh()
-        return self._skills.copy()
+        await self.ensure_fresh()
+        return self._skills
 
-    async def get_domains(self) -> list[str]:
+    async def get_domains(self) -> tuple[str, ...]:
         """Get all available domains"""
-        await self._ensure_cache_fresh()
-        return self._domains.copy()
+        await self.ensure_fresh()
+        return self._domains
 
-    @sentry_sdk.trace
     async def get_skill_by_term(self, term: str) -> SkillInfo | None:
         """Find skill by name or alias (case-insensitive)"""
-        await self._ensure_cache_fresh()
-        term_lower = term.lower()
-
-        for skill in self._skills:
-            # Check skill name
-            if skill.name.lower() == term_lower:
-                return skill
-
-            # Check aliases
-            if hasattr(skill, "aliases") and skill.aliases:
-                for alias in skill.aliases:
-                    if alias.lower() == term_lower:
-                        return skill
-
-        return None
+        await self.ensure_fresh()
+        return self._term_to_skill.get(term.lower())
 
     @sentry_sdk.trace
     async def refresh_cache(self) -> bool:
@@ -83,17 +97,23 @@ class SkillCacheService:
                 logger.info(f"Expert API returned {len(skills_response.skills)} skills")
 
                 # Update cache
-                self._skills = skills_response.skills
-                self._domains = skills_response.domains
+                # Published as immutable tuples/frozensets so getters can hand
+                # them out without copying
+                self._skills = tuple(skills_response.skills)
+                self._domains = tuple(skills_response.domains)
                 self._skill_names = set()
                 self._skill_aliases = set()
-                self._all_skill_terms = set()
+                all_skill_terms = set()
+                self._term_to_skill = {}
 
                 # Build lookup sets
+                # (first skill claiming a term wins)
                 for skill in self._skills:
-                    skill_name_lower = skill.name.lower()
+                    # Interned so every lookup table shares one copy of each term
+                    skill_name_lower = sys.intern(skill.name.lower())
                     self._skill_names.add(skill_name_lower)
-                    self._all_skill_terms.add(skill_name_lower)
+                    all_skill_terms.add(skill_name_lower)
+                    self._term_to_skill.setdefault(skill_name_lower, skill)
 
                     # Add aliases if they exist
                     logger.debug(
@@ -104,15 +124,25 @@ class SkillCacheService:
                             f"Skill {skill.key} has {len(skill.aliases)} aliases: {skill.aliases}"
                         )
                         for alias in skill.aliases:
-                            alias_lower = alias.lower()
+                            alias_lower = sys.intern(alias.lower())
                             self._skill_aliases.add(alias_lower)
-                            self._all_skill_terms.add(alias_lower)
+                            all_skill_terms.add(alias_lower)
+                            self._term_to_skill.setdefault(alias_lower, skill)
                     else:
                         logger.debug(
                             f"Skill {skill.key} has no aliases or aliases attr missing"
                         )
 
+                self._all_skill_terms = frozenset(all_skill_terms)
+                self._snapshot = SkillSnapshot(
+                    all_skill_terms=self._all_skill_terms,
+                    automaton=self._build_automaton(self._term_to_skill),
+                    substring_to_keys=self._build_substring_index(
+                        self._all_skill_terms, self._term_to_skill
+                    ),
+                )
                 self._last_refresh = datetime.now()
+                self._last_refresh_monotonic = time.monotonic()
 
                 logger.info(
                     f"Skill cache refreshed successfully: "
@@ -126,18 +156,58 @@ class SkillCacheService:
                 logger.error(f"Failed to refresh skill cache: {e}", exc_info=True)
                 return False
 
-    async def _ensure_cache_fresh(self):
-        """Ensure cache is fresh, refresh if needed"""
-        if self._needs_refresh():
+    def _build_automaton(
+        self, term_to_skill: dict[str, SkillInfo]
+    ) -> ahocorasick.Automaton | None:
+        """Build a multi-pattern matcher over all skill names and aliases"""
+        automaton = ahocorasick.Automaton()
+
+        for term, skill in term_to_skill.items():
+            if term:
+                automaton.add_word(term, (skill.key, len(term)))
+
+        if len(automaton) == 0:
+            return None
+
+        automaton.make_automaton()
+        return automaton
+
+    def _build_substring_index(
+        self, terms: frozenset[str], term_to_skill: dict[str, SkillInfo]
+    ) -> dict[str, tuple[str, ...]]:
+        """Index every substring of 3+ chars of each term by the skills containing it"""
+        index: dict[str, dict[str, None]] = {}
+
+        for term in terms:
+            skill_key = term_to_skill[term].key
+            for start in range(len(term) - 2):
+                for end in range(start + 3, len(term) + 1):
+                    index.setdefault(term[start:end], {})[skill_key] = None
+
+        return {substring: tuple(keys) for substring, keys in index.items()}
+
+    async def ensure_fresh(self):
+        """Ensure cache is loaded, refreshing a stale cache in the background"""
+        if not self._needs_refresh():
+            return
+
+        # Nothing cached yet, so callers have to wait for the first load
+        if self._last_refresh_monotonic is None:
             await self.refresh_cache()
+            return
+
+        # Serve stale data while a single background task refreshes it
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self.refresh_cache())
 
     def _needs_refresh(self) -> bool:
         """Check if cache needs refreshing"""
-        if self._last_refresh is None:
+        if self._last_refresh_monotonic is None:
             return True
 
-        age = datetime.now() - self._last_refresh
-        return age > self.cache_ttl
+        # Monotonic clock: cheap to read and unaffected by wall clock changes
+        age = time.monotonic() - self._last_refresh_monotonic
+        return age > self._cache_ttl_seconds
 
     def get_cache_stats(self) -> dict[str, any]:
         """Get cache statistics for debugging"""
@@ -151,8 +221,8 @@ class SkillCacheService:
                 self._last_refresh.isoformat() if self._last_refresh else None
             ),
             "cache_age_minutes": (
-                (datetime.now() - self._last_refresh).total_seconds() / 60
-                if self._last_refresh
+                (time.monotonic() - self._last_refresh_monotonic) / 60
+                if self._last_refresh_monotonic is not None
                 else None
             ),
             "needs_refresh": self._needs_refresh(),
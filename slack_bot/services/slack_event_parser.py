@@ -10,131 +10,140 @@ from models.slack_models import ParsedSlackMessage, SlackEventContext
 
 logger = logging.getLogger(__name__)
 
+# Patterns for cleaning Slack messages. Slack IDs and markup are plain ASCII.
+_MENTION_PATTERN = re.compile(r"<@([UW][A-Z0-9]+)>", re.ASCII)
+_CHANNEL_PATTERN = re.compile(r"<#C[A-Z0-9]+\|[^>]+>", re.ASCII)
+_URL_PATTERN = re.compile(r"<https?://[^>]+>", re.ASCII)
+_FORMATTING_PATTERN = re.compile(r"[*_~`]", re.ASCII)
+
+# All of the above in one alternation, so cleaning is a single pass
+_DECORATION_PATTERN = re.compile(
+    "|".join(
+        pattern.pattern
+        for pattern in (
+            _MENTION_PATTERN,
+            _CHANNEL_PATTERN,
+            _URL_PATTERN,
+            _FORMATTING_PATTERN,
+        )
+    ),
+    re.ASCII,
+)
+
+# Slack event and channel types checked on every event
+_EVENT_CALLBACK = "event_callback"
+_APP_MENTION = "app_mention"
+_MESSAGE = "message"
+_IM = "im"
+
 
 class SlackEventParser:
     """Parses Slack events and extracts relevant information"""
 
+    __slots__ = ("bot_user_id", "_bot_mention_token")
+
     def __init__(self, bot_user_id: str | None = None):
         self.bot_user_id = bot_user_id
 
-        # Patterns for cleaning Slack messages
-        self.mention_pattern = re.compile(r"<@[UW][A-Z0-9]+>")
-        self.channel_pattern = re.compile(r"<#[C][A-Z0-9]+\|[^>]+>")
-        self.url_pattern = re.compile(r"<https?://[^>]+>")
-        self.formatting_pattern = re.compile(r"[*_~`]")
+        # How a mention of the bot appears in raw message text
+        self._bot_mention_token = f"<@{bot_user_id}>" if bot_user_id else None
 
     @sentry_sdk.trace
     def parse_event(self, event_data: dict[str, Any]) -> SlackEventContext | None:
         """Parse a Slack event and return context information"""
-        try:
-            event_type = event_data.get("type", "")
-
-            context = SlackEventContext(
-                event_type=event_type,
-                event_id=event_data.get("event_id"),
-                team_id=event_data.get("team_id"),
-                api_app_id=event_data.get("api_app_id"),
-                bot_user_id=self.bot_user_id,
-                raw_event=event_data,
-            )
-
-            # Check if this is an event_callback with a nested event
-            if event_type == "event_callback" and "event" in event_data:
-                nested_event = event_data["event"]
-                nested_type = nested_event.get("type", "")
-
-                # Check if bot was mentioned
-                if nested_type == "app_mention":
-                    context.bot_mentioned = True
-                elif nested_type == "message":
-                    # Check if it's a DM or if bot was mentioned in the text
-                    channel_type = nested_event.get("channel_type", "")
-                    text = nested_event.get("text", "")
-
-                    if channel_type == "im":
-                        context.bot_mentioned = True
-                    elif self.bot_user_id and f"<@{self.bot_user_id}>" in text:
-                        context.bot_mentioned = True
+        if not isinstance(event_data, dict):
+            logger.error("Cannot parse Slack event of type %s", type(event_data))
+            return None
 
-            return context
+        event_type = event_data.get("type", "")
+
+        context = SlackEventContext(
+            event_type=event_type,
+            event_id=event_data.get("event_id"),
+            team_id=event_data.get("team_id"),
+            api_app_id=event_data.get("api_app_id"),
+            bot_user_id=self.bot_user_id,
+        )
+
+        # Check if this is an event_callback with a nested event
+        nested_event = event_data.get("event")
+        if event_type == _EVENT_CALLBACK and isinstance(nested_event, dict):
+            nested_type = nested_event.get("type", "")
+
+            # Check if bot was mentioned
+            if nested_type == _APP_MENTION:
+                context.bot_mentioned = True
+            elif nested_type == _MESSAGE:
+                # Check if it's a DM or if bot was mentioned in the text
+                channel_type = nested_event.get("channel_type", "")
+                text = nested_event.get("text") or ""
+
+                if channel_type == _IM:
+                    context.bot_mentioned = True
+                elif self._bot_mention_token and self._bot_mention_token in text:
+                    context.bot_mentioned = True
 
-        except Exception as e:
-            logger.error(f"Error parsing Slack event: {e}")
-            return None
+        return context
 
     @sentry_sdk.trace
     def parse_message(self, event: dict[str, Any]) -> ParsedSlackMessage | None:
         """Parse a Slack message event into a structured format"""
-        try:
-            text = event.get("text", "")
-            user_id = event.get("user", "")
-            channel_id = event.get("channel", "")
-            timestamp = event.get("ts", "")
-            thread_ts = event.get("thread_ts")
-            event_type = event.get("type", "")
-
-            # Clean the message text
-            cleaned_text = self._clean_message_text(text)
-
-            # Extract mentioned users
-            mentioned_users = self._extract_mentioned_users(text)
-
-            # Determine message characteristics
-            is_app_mention = event_type == "app_mention"
-            is_direct_message = event.get("channel_type") == "im"
-
-            parsed_message = ParsedSlackMessage(
-                text=text,
-                cleaned_text=cleaned_text,
-                user_id=user_id,
-                channel_id=channel_id,
-                timestamp=timestamp,
-                thread_ts=thread_ts,
-                is_app_mention=is_app_mention,
-                is_direct_message=is_direct_message,
-                mentioned_users=mentioned_users,
-            )
-
-            logger.info(f"Parsed message from {user_id}: '{cleaned_text[:50]}...'")
-            return parsed_message
-
-        except Exception as e:
-            logger.error(f"Error parsing message: {e}")
+        if not isinstance(event, dict):
+            logger.error("Cannot parse Slack message of type %s", type(event))
             return None
 
-    @sentry_sdk.trace
-    def _clean_message_text(self, text: str) -> str:
-        """Clean Slack message text by removing mentions, links, and formatting"""
-        # Remove user mentions
-        text = self.mention_pattern.sub("", text)
-
-        # Remove channel mentions
-        text = self.channel_pattern.sub("", text)
-
-        # Remove URLs
-        text = self.url_pattern.sub("", text)
-
-        # Remove formatting characters
-        text = self.formatting_pattern.sub("", text)
-
-        # Clean up whitespace
-        text = " ".join(text.split())
-
-        return text.strip()
-
-    @sentry_sdk.trace
-    def _extract_mentioned_users(self, text: str) -> list[str]:
-        """Extract user IDs from mentions in the text"""
-        mentions = self.mention_pattern.findall(text)
-        user_ids = []
-
-        for mention in mentions:
-            # Extract user ID from <@U12345> format
-            user_id = mention[2:-1]  # Remove <@ and >
-            if user_id.startswith("U") or user_id.startswith("W"):
-                user_ids.append(user_id)
-
-        return user_ids
+        get = event.get  # Bound once; read for every field below
+        text = get("text") or ""  # Absent or null for some subtypes
+        user_id = get("user", "")
+        channel_id = get("channel", "")
+        timestamp = get("ts", "")
+        thread_ts = get("thread_ts")
+
+        # Determine message characteristics
+        is_app_mention = get("type") == _APP_MENTION
+        is_direct_message = get("channel_type") == _IM
+
+        # Clean the message text and extract mentioned users, but only for
+        # messages should_process_message can accept; it drops the rest anyway
+        if is_app_mention or is_direct_message:
+            cleaned_text, mentioned_users = self._parse_text(text)
+        else:
+            cleaned_text, mentioned_users = "", []
+
+        parsed_message = ParsedSlackMessage(
+            text=text,
+            cleaned_text=cleaned_text,
+            user_id=user_id,
+            channel_id=channel_id,
+            timestamp=timestamp,
+            thread_ts=thread_ts,
+            is_app_mention=is_app_mention,
+            is_direct_message=is_direct_message,
+            mentioned_users=mentioned_users,
+        )
+
+        # %.50s truncates only when the record is actually formatted
+        logger.info("Parsed message from %s: '%.50s...'", user_id, cleaned_text)
+        return parsed_message
+
+    def _parse_text(self, text: str) -> tuple[str, list[str]]:
+        """Clean Slack message text and extract the user IDs it mentions"""
+        # Fast path: most messages contain no Slack markup at all, and every
+        # decoration starts with (or is) one of these characters
+        if not (
+            "<" in text or "*" in text or "_" in text or "~" in text or "`" in text
+        ):
+            return " ".join(text.split()), []
+
+        # The pattern captures the U/W-prefixed ID inside <@...>; without a
+        # "<@" there is nothing for it to find
+        mentioned_users = _MENTION_PATTERN.findall(text) if "<@" in text else []
+
+        # Remove user mentions, channel mentions, URLs and formatting characters
+        text = _DECORATION_PATTERN.sub("", text)
+
+        # Clean up whitespace (split() also drops leading and trailing space)
+        return " ".join(text.split()), mentioned_users
 
     def should_process_message(self, parsed_message: ParsedSlackMessage) -> bool:
         """Determine if this message should be processed for expert search"""